@@ -1,13 +1,108 @@
-from PyQt5.QtWidgets import QApplication, QWidget, QDesktopWidget, QMenu, QAction
-from PyQt5.QtCore import Qt, QTimer, QPoint, QPropertyAnimation, QEasingCurve, pyqtProperty
-from PyQt5.QtGui import QPainter, QColor, QPen, QBrush
-from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent
+from PyQt5.QtWidgets import QApplication, QWidget, QMenu
+from PyQt5.QtCore import Qt, QTimer, QPoint, QPropertyAnimation, QEasingCurve, pyqtProperty, QEvent
+from PyQt5.QtGui import QPainter, QColor, QPen, QBrush, QCursor, QPixmap
+from PyQt5.QtMultimedia import QMediaPlayer, QMediaContent, QSoundEffect
 from PyQt5.QtCore import QUrl
 import sys
-import json
 import math
 import os
-from pynput import mouse, keyboard
+import time
+from enum import IntEnum
+from functools import lru_cache
+
+# Use orjson for config (de)serialization when available
+try:
+    import orjson
+
+    json_loads = orjson.loads
+
+    def json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+
+    json_loads = json.loads
+
+    def json_dumps(obj):
+        # Same 2-space layout as orjson so config.json doesn't churn
+        return json.dumps(obj, indent=2).encode()
+
+class Phase(IntEnum):
+    """Pomodoro phases; values index the paint dispatch table"""
+    WAITING = 0
+    WORKING = 1
+    RESTING = 2
+    COMPLETING = 3
+
+
+@lru_cache(maxsize=32)
+def parse_color(color_str):
+    """Parse color string and return QColor (cached, so don't modify the result)"""
+    if color_str.startswith('rgba'):
+        # Parse rgba(r, g, b, a) format
+        values = color_str.replace('rgba(', '').replace(')', '').split(',')
+        if len(values) == 4:
+            r, g, b, a = [int(v.strip()) for v in values]
+            return QColor(r, g, b, a)
+    return QColor(color_str)
+
+
+COMPLETION_FRAME_MS = 33  # Completion animation frame interval (~30 FPS)
+
+# Preformatted "MM:SS" strings for up to an hour remaining, indexed by seconds
+TIME_STRINGS = tuple(f"{i // 60:02d}:{i % 60:02d}" for i in range(60 * 60 + 1))
+
+
+@lru_cache(maxsize=None)
+def completion_keyframes(duration):
+    """Precompute (scale, rotation, morph, opacity) for every completion frame"""
+    sin = math.sin
+    keyframes = []
+    for frame in range(math.ceil(duration / COMPLETION_FRAME_MS)):
+        elapsed = frame * COMPLETION_FRAME_MS  # milliseconds elapsed
+        
+        # Enhanced dizzy animation with multiple phases
+        progress = elapsed / duration
+        pi_progress = progress * math.pi
+        
+        # Phase 1: Rapid growth (0-20%)
+        if progress < 0.2:
+            phase_progress = progress / 0.2
+            base_scale = 1.0 + 5.0 * phase_progress  # Grow to 6x size quickly
+        # Phase 2: Maximum wobble (20-70%)
+        elif progress < 0.7:
+            phase_progress = (progress - 0.2) / 0.5
+            base_scale = 6.0  # Stay at maximum size
+        # Phase 3: Return to normal (70-100%)
+        else:
+            phase_progress = (progress - 0.7) / 0.3
+            base_scale = 6.0 - 5.0 * phase_progress  # Shrink back to normal
+        
+        # Multiple wobble frequencies for dizzy effect
+        wobble1 = 1.0 * sin(pi_progress * 18)  # Fast wobble
+        wobble2 = 0.5 * sin(pi_progress * 28)  # Faster wobble
+        wobble3 = 0.3 * sin(pi_progress * 40)  # Even faster wobble
+        
+        # Rotation effect - multiple rotations
+        rotation = progress * 720 + 180 * sin(pi_progress * 8)  # 2 full rotations + wobble
+        
+        # Shape morphing
+        morph = 0.8 * sin(pi_progress * 12)  # Morph between circle and oval
+        
+        scale = base_scale + wobble1 + wobble2 + wobble3
+        
+        # Opacity pulsing with multiple frequencies
+        opacity_pulse1 = 0.3 * sin(pi_progress * 15)
+        opacity_pulse2 = 0.2 * sin(pi_progress * 25)
+        opacity = 0.6 + opacity_pulse1 + opacity_pulse2
+        
+        # Ensure values stay in reasonable bounds
+        scale = max(0.5, min(7.0, scale))
+        opacity = max(0.3, min(1.0, opacity))
+        
+        keyframes.append((scale, rotation, morph, opacity))
+    return tuple(keyframes)
+
 
 class CircleWindow(QWidget):
     def __init__(self):
@@ -25,50 +120,78 @@ class CircleWindow(QWidget):
         if self.position_x is not None and self.position_y is not None:
             self.move(max(0, self.position_x), max(0, self.position_y))
         
-        # Phase states: 'waiting', 'working', 'resting'
-        self.phase = 'waiting'
+        # Phase states: waiting, working, resting, completing
+        self.phase = Phase.WAITING
         self.progress = 1.0  # Start full for waiting phase
+        self._last_angle = None  # Last pie angle painted by update_progress
         self.elapsed = 0
         self.is_paused = False  # Add pause state
         self.paused_time = 0
         self.is_locked = False  # Add lock state
 
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_progress)
-        self.timer.start(1000)  # update every second
+        # Single timer driving progress and animations; interval depends on phase
+        self._tick_timer = QTimer(self)
+        self._tick_timer.timeout.connect(self._on_tick)
+        self._tick_ms = 0  # Milliseconds accumulated towards the next progress update
 
-        # Input listeners (only active during waiting phase)
-        self.mouse_listener = None
-        self.keyboard_listener = None
+        # Activity detection (only active during waiting phase)
+        self.listening = False
+        self.last_cursor_pos = None
         self.start_listeners()
         
         # Drag and drop functionality (immediate)
         self.drag_start_position = QPoint()
         self.is_dragging = False
 
+        # Screen bounds used to constrain dragging
+        self._screen = None
+        QApplication.instance().primaryScreenChanged.connect(self.watch_primary_screen)
+        self.watch_primary_screen(QApplication.primaryScreen())
+
+        # Deferred config write after the window settles
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self._flush_config)
+
         # Animation properties
         self._animation_scale = 1.0
         self._animation_opacity = 1.0
         self._animation_rotation = 0.0
         self._shape_morph = 0.0
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self.update_animation)
         self.animation_frame = 0
+        self._last_paint_scale = None  # Scale/opacity of the last animation repaint
+        self._last_paint_opacity = None
+        self._pie_cache = {}  # Rendered progress pies keyed by (rgba, angle, pixel ratio)
+
+        # Paint handlers indexed by Phase value
+        self._paint_dispatch = (
+            self.paint_waiting,
+            self.paint_working,
+            self.paint_resting,
+            self.paint_completing,
+        )
         
         # Screen completion animation functionality
-        self.completion_animation_timer = None
         self.completion_frame = 0
+        self.completion_duration = 5000
+        self._completing_colors = [self._qc_working]
+
+        # Right-click menu, built once and refreshed on each show
+        self.create_context_menu()
 
         # Audio player for notification sound
-        self.media_player = QMediaPlayer()
+        self.sound_effect = None
+        self.media_player = None
+        self.load_notification_sound()
 
         self.start_waiting_animation()
 
     def load_config(self):
         """Load configuration from config.json"""
         try:
-            with open('config.json', 'r') as f:
-                config = json.load(f)
+            with open('config.json', 'rb') as f:
+                config = json_loads(f.read())
+                self._config = config
                 
                 # Time settings
                 self.work_duration = config.get('work_time_minutes', 25) * 60
@@ -94,6 +217,7 @@ class CircleWindow(QWidget):
                 
         except FileNotFoundError:
             print("config.json not found, using default values")
+            self._config = {}
             self.work_duration = 25 * 60
             self.rest_duration = 5 * 60
             self.size = 60
@@ -105,40 +229,37 @@ class CircleWindow(QWidget):
             self.position_y = None
             self.notification_sound = 'notification.mp3'
 
+        # Parse colors once; they don't change after loading
+        self._qc_background = parse_color(self.color_background)
+        self._qc_working = parse_color(self.color_working)
+        self._qc_resting = parse_color(self.color_resting)
+        self._qc_waiting = parse_color(self.color_waiting)
+
     def save_position(self):
-        """Save current position to config.json"""
+        """Save current position to config.json (debounced)"""
+        self._config['position'] = {
+            'x': max(0, self.x()),
+            'y': max(0, self.y())
+        }
+        # Restart the timer so a burst of drags only writes once
+        self.save_timer.start(500)
+
+    def _flush_config(self):
+        """Write the cached configuration back to config.json"""
         try:
-            with open('config.json', 'r') as f:
-                config = json.load(f)
-            
-            config['position'] = {
-                'x': max(0, self.x()),
-                'y': max(0, self.y())
-            }
-            
-            with open('config.json', 'w') as f:
-                json.dump(config, f, indent=4)
+            with open('config.json', 'wb') as f:
+                f.write(json_dumps(self._config))
                 
         except Exception as e:
             print(f"Error saving position: {e}")
 
-    def parse_color(self, color_str):
-        """Parse color string and return QColor"""
-        if color_str.startswith('rgba'):
-            # Parse rgba(r, g, b, a) format
-            values = color_str.replace('rgba(', '').replace(')', '').split(',')
-            if len(values) == 4:
-                r, g, b, a = [int(v.strip()) for v in values]
-                return QColor(r, g, b, a)
-        return QColor(color_str)
-
     def get_time_remaining_text(self):
         """Get formatted time remaining text"""
-        if self.phase == 'waiting':
+        if self.phase == Phase.WAITING:
             return "Waiting for activity..."
-        elif self.phase == 'completing':
+        elif self.phase == Phase.COMPLETING:
             return "Celebration!"
-        elif self.phase == 'working':
+        elif self.phase == Phase.WORKING:
             remaining = self.work_duration - self.elapsed
         else:  # resting
             remaining = self.rest_duration - self.elapsed
@@ -146,82 +267,85 @@ class CircleWindow(QWidget):
         if self.is_paused:
             remaining = remaining  # Show actual remaining time when paused
         
+        if 0 <= remaining < len(TIME_STRINGS):
+            return TIME_STRINGS[remaining]
         minutes = remaining // 60
         seconds = remaining % 60
         return f"{minutes:02d}:{seconds:02d}"
 
-    def contextMenuEvent(self, event):
-        """Handle right-click context menu"""
-        menu = QMenu(self)
+    def create_context_menu(self):
+        """Build the right-click context menu once; contextMenuEvent refreshes it"""
+        self._menu = QMenu(self)
         
         # Time remaining (disabled action as header)
-        time_action = QAction(f"⏱️ {self.get_time_remaining_text()}", self)
-        time_action.setEnabled(False)
-        menu.addAction(time_action)
+        self._act_time = self._menu.addAction("")
+        self._act_time.setEnabled(False)
         
         # Phase info
-        phase_text = f"📍 {self.phase.title()} Phase"
-        if self.is_paused:
-            phase_text += " (Paused)"
-        phase_action = QAction(phase_text, self)
-        phase_action.setEnabled(False)
-        menu.addAction(phase_action)
+        self._act_phase = self._menu.addAction("")
+        self._act_phase.setEnabled(False)
         
-        menu.addSeparator()
+        self._menu.addSeparator()
         
         # Pause/Resume button
-        if self.phase in ['working', 'resting'] and not self.phase == 'completing':
-            if self.is_paused:
-                pause_action = QAction("▶️ Resume", self)
-                pause_action.triggered.connect(self.resume_timer)
-            else:
-                pause_action = QAction("⏸️ Pause", self)
-                pause_action.triggered.connect(self.pause_timer)
-            menu.addAction(pause_action)
+        self._act_pause = self._menu.addAction("")
+        self._act_pause.triggered.connect(self.toggle_pause)
         
         # Skip to next phase
-        if self.phase == 'working':
-            skip_action = QAction("⏭️ Skip to Rest", self)
-            skip_action.triggered.connect(self.skip_to_rest)
-            menu.addAction(skip_action)
-        elif self.phase == 'resting':
-            skip_action = QAction("⏭️ Skip to Waiting", self)
-            skip_action.triggered.connect(self.skip_to_waiting)
-            menu.addAction(skip_action)
-        elif self.phase == 'waiting':
-            start_action = QAction("▶️ Start Work", self)
-            start_action.triggered.connect(self.start_work_phase)
-            menu.addAction(start_action)
-        
-        menu.addSeparator()
+        self._act_skip_rest = self._menu.addAction("⏭️ Skip to Rest")
+        self._act_skip_rest.triggered.connect(self.skip_to_rest)
+        self._act_skip_waiting = self._menu.addAction("⏭️ Skip to Waiting")
+        self._act_skip_waiting.triggered.connect(self.skip_to_waiting)
+        self._act_start = self._menu.addAction("▶️ Start Work")
+        self._act_start.triggered.connect(self.start_work_phase)
+        
+        self._menu.addSeparator()
         
         # Lock/Unlock toggle
-        if self.is_locked:
-            lock_action = QAction("🔓 Unlock Position", self)
-            lock_action.triggered.connect(self.toggle_lock)
-        else:
-            lock_action = QAction("🔒 Lock Position", self)
-            lock_action.triggered.connect(self.toggle_lock)
-        menu.addAction(lock_action)
+        self._act_lock = self._menu.addAction("")
+        self._act_lock.triggered.connect(self.toggle_lock)
         
         # Restart
-        restart_action = QAction("⟳ Restart", self)
-        restart_action.triggered.connect(self.restart_pomodoro)
-        menu.addAction(restart_action)
+        self._act_restart = self._menu.addAction("⟳ Restart")
+        self._act_restart.triggered.connect(self.restart_pomodoro)
         
-        menu.addSeparator()
+        self._menu.addSeparator()
         
         # Exit
-        exit_action = QAction("❌ Exit", self)
-        exit_action.triggered.connect(self.close)
-        menu.addAction(exit_action)
+        self._act_exit = self._menu.addAction("❌ Exit")
+        self._act_exit.triggered.connect(self.close)
+
+    def contextMenuEvent(self, event):
+        """Handle right-click context menu"""
+        self._act_time.setText(f"⏱️ {self.get_time_remaining_text()}")
+        
+        phase_text = f"📍 {self.phase.name.title()} Phase"
+        if self.is_paused:
+            phase_text += " (Paused)"
+        self._act_phase.setText(phase_text)
+        
+        self._act_pause.setVisible(self.phase in (Phase.WORKING, Phase.RESTING))
+        self._act_pause.setText("▶️ Resume" if self.is_paused else "⏸️ Pause")
+        
+        self._act_skip_rest.setVisible(self.phase == Phase.WORKING)
+        self._act_skip_waiting.setVisible(self.phase == Phase.RESTING)
+        self._act_start.setVisible(self.phase == Phase.WAITING)
+        
+        self._act_lock.setText("🔓 Unlock Position" if self.is_locked else "🔒 Lock Position")
         
         # Show menu at cursor position
-        menu.exec_(event.globalPos())
+        self._menu.exec_(event.globalPos())
+
+    def toggle_pause(self):
+        """Pause or resume depending on the current state"""
+        if self.is_paused:
+            self.resume_timer()
+        else:
+            self.pause_timer()
 
     def pause_timer(self):
         """Pause the current timer"""
-        if self.phase in ['working', 'resting'] and not self.is_paused:
+        if self.phase in (Phase.WORKING, Phase.RESTING) and not self.is_paused:
             self.is_paused = True
             self.paused_time = self.elapsed
             print(f"Timer paused at {self.get_time_remaining_text()}")
@@ -234,12 +358,12 @@ class CircleWindow(QWidget):
 
     def skip_to_rest(self):
         """Skip work phase and go to rest"""
-        if self.phase == 'working' or self.phase == 'completing':
+        if self.phase == Phase.WORKING or self.phase == Phase.COMPLETING:
             self.start_completion_animation()
 
     def skip_to_waiting(self):
         """Skip rest phase and go to waiting"""
-        if self.phase == 'resting':
+        if self.phase == Phase.RESTING:
             self.start_waiting_phase()
 
     def toggle_lock(self):
@@ -256,96 +380,126 @@ class CircleWindow(QWidget):
         self.start_waiting_phase()
         print("Pomodoro restarted")
 
-    def play_notification_sound(self):
-        """Play notification sound when work ends"""
+    def load_notification_sound(self):
+        """Load notification sound once at startup"""
+        self._sound_loaded = False
         try:
             sound_path = os.path.join('assets', 'notification-sound', self.notification_sound)
             if os.path.exists(sound_path):
                 url = QUrl.fromLocalFile(os.path.abspath(sound_path))
-                self.media_player.setMedia(QMediaContent(url))
-                self.media_player.play()
+                if sound_path.lower().endswith('.wav'):
+                    # Low-latency playback for uncompressed sounds
+                    self.sound_effect = QSoundEffect(self)
+                    self.sound_effect.setSource(url)
+                    self.sound_effect.setVolume(1.0)
+                else:
+                    # QSoundEffect only handles WAV, so other formats need the full media player
+                    self.media_player = QMediaPlayer()
+                    self.media_player.setMedia(QMediaContent(url))
+                self._sound_loaded = True
             else:
                 print(f"Sound file not found: {sound_path}")
+        except Exception as e:
+            print(f"Error loading sound: {e}")
+
+    def play_notification_sound(self):
+        """Play notification sound when work ends"""
+        if not self._sound_loaded:
+            return
+        try:
+            if self.sound_effect is not None:
+                self.sound_effect.play()
+            else:
+                self.media_player.stop()  # Rewind in case it is still playing
+                self.media_player.play()
         except Exception as e:
             print(f"Error playing sound: {e}")
 
     def start_completion_animation(self):
         """Start dizzy animation when work phase completes"""
-        self.phase = 'completing'  # New phase for completion animation
+        self.phase = Phase.COMPLETING  # New phase for completion animation
+        self._last_angle = None
         self.stop_animation()  # Stop any other animations
         self.play_notification_sound()  # Play sound when work ends
-        self.completion_animation_timer = QTimer(self)
-        self.completion_animation_timer.timeout.connect(self.update_completion_animation)
         self.completion_frame = 0
         self.completion_duration = 5000  # 5 seconds for better animation
-        self.completion_animation_timer.start(33)  # 30 FPS for smoother animation
+        self._completion_keyframes = completion_keyframes(self.completion_duration)
+        # Precompute the work -> rest color for every animation frame
+        work_color = self._qc_working
+        rest_color = self._qc_resting
+        dr = rest_color.red() - work_color.red()
+        dg = rest_color.green() - work_color.green()
+        db = rest_color.blue() - work_color.blue()
+        self._completing_colors = []
+        for frame in range(math.ceil(self.completion_duration / COMPLETION_FRAME_MS)):
+            progress = min(1.0, (frame * COMPLETION_FRAME_MS) / self.completion_duration)
+            self._completing_colors.append(QColor(
+                int(work_color.red() + dr * progress),
+                int(work_color.green() + dg * progress),
+                int(work_color.blue() + db * progress)
+            ))
+        # Nobody can see the celebration while minimized, so go straight to rest
+        if self.isMinimized():
+            self.finish_completion_animation()
+            return
+        self.set_tick_interval(COMPLETION_FRAME_MS)  # 30 FPS for smoother animation
         print("Work completed! Starting celebration animation...")
 
     def update_completion_animation(self):
         """Update completion dizzy animation"""
         self.completion_frame += 1
-        elapsed = self.completion_frame * 33  # milliseconds elapsed
+        elapsed = self.completion_frame * COMPLETION_FRAME_MS  # milliseconds elapsed
         
         if elapsed >= self.completion_duration:
-            self.completion_animation_timer.stop()
-            self._animation_scale = 1.0
-            self._animation_opacity = 1.0
-            self._animation_rotation = 0.0
-            self._shape_morph = 0.0
-            self.start_rest_phase()  # Now start rest phase after animation completes
+            self.finish_completion_animation()
             return
         
-        # Enhanced dizzy animation with multiple phases
-        progress = elapsed / self.completion_duration
-        
-        # Phase 1: Rapid growth (0-20%)
-        if progress < 0.2:
-            phase_progress = progress / 0.2
-            base_scale = 1.0 + 5.0 * phase_progress  # Grow to 6x size quickly
-        # Phase 2: Maximum wobble (20-70%)
-        elif progress < 0.7:
-            phase_progress = (progress - 0.2) / 0.5
-            base_scale = 6.0  # Stay at maximum size
-        # Phase 3: Return to normal (70-100%)
-        else:
-            phase_progress = (progress - 0.7) / 0.3
-            base_scale = 6.0 - 5.0 * phase_progress  # Shrink back to normal
-        
-        # Multiple wobble frequencies for dizzy effect
-        wobble1 = 1.0 * math.sin(progress * math.pi * 18)  # Fast wobble
-        wobble2 = 0.5 * math.sin(progress * math.pi * 28)  # Faster wobble
-        wobble3 = 0.3 * math.sin(progress * math.pi * 40)  # Even faster wobble
-        
-        # Rotation effect - multiple rotations
-        self._animation_rotation = progress * 720 + 180 * math.sin(progress * math.pi * 8)  # 2 full rotations + wobble
+        # Look up the precomputed keyframe for this frame
+        (self._animation_scale, self._animation_rotation,
+         self._shape_morph, self._animation_opacity) = self._completion_keyframes[self.completion_frame]
         
-        # Shape morphing
-        self._shape_morph = 0.8 * math.sin(progress * math.pi * 12)  # Morph between circle and oval
-        
-        self._animation_scale = base_scale + wobble1 + wobble2 + wobble3
-        
-        # Opacity pulsing with multiple frequencies
-        opacity_pulse1 = 0.3 * math.sin(progress * math.pi * 15)
-        opacity_pulse2 = 0.2 * math.sin(progress * math.pi * 25)
-        self._animation_opacity = 0.6 + opacity_pulse1 + opacity_pulse2
+        self.update()
+
+    def finish_completion_animation(self):
+        """End the completion animation and move on to the rest phase"""
+        self._animation_scale = 1.0
+        self._animation_opacity = 1.0
+        self._animation_rotation = 0.0
+        self._shape_morph = 0.0
+        self.start_rest_phase()  # Now start rest phase after animation completes
+
+    def set_tick_interval(self, interval):
+        """Reprogram the shared tick timer for the current phase"""
+        self._tick_ms = 0
+        self._last_paint_scale = None  # Force the next animation frame to repaint
+        self._tick_timer.start(interval)
+
+    def _on_tick(self):
+        """Dispatch a timer tick to the handlers for the current phase"""
+        if self.phase == Phase.COMPLETING:
+            self.update_completion_animation()
+            return
         
-        # Ensure values stay in reasonable bounds
-        self._animation_scale = max(0.5, min(7.0, self._animation_scale))
-        self._animation_opacity = max(0.3, min(1.0, self._animation_opacity))
+        # Progress advances once per second regardless of the tick rate
+        self._tick_ms += self._tick_timer.interval()
+        if self._tick_ms >= 1000:
+            self._tick_ms -= 1000
+            self.update_progress()
         
-        self.update()
+        if self.phase in (Phase.WAITING, Phase.RESTING):
+            self.update_animation()
 
     def start_waiting_animation(self):
         """Start slow breathing animation for waiting phase"""
-        self.animation_timer.start(100)  # Slower update rate
+        self._waiting_since = time.monotonic()
+        self.set_tick_interval(100)  # Slower update rate
 
     def start_resting_animation(self):
         """Start pulse animation for resting phase"""
-        self.animation_timer.start(50)  # Faster update rate for pulse
+        self.set_tick_interval(50)  # Faster update rate for pulse
 
     def stop_animation(self):
         """Stop all animations"""
-        self.animation_timer.stop()
         self._animation_scale = 1.0
         self._animation_opacity = 1.0
         self._animation_rotation = 0.0
@@ -353,20 +507,44 @@ class CircleWindow(QWidget):
 
     def update_animation(self):
         """Update animation frame"""
-        self.animation_frame += 1
+        if self.phase == Phase.WAITING:
+            # Back off to a slower tick once we've been idle for a while
+            if (self._tick_timer.interval() < 500
+                    and time.monotonic() - self._waiting_since >= 60):
+                self.set_tick_interval(500)
+            # Advance one frame per 100 ms so the breathing speed stays the same
+            step = self._tick_timer.interval() // 100
+        else:
+            step = 1
         
-        if self.phase == 'waiting':
+        # Nothing to show if the window isn't exposed (e.g. minimized)
+        handle = self.windowHandle()
+        if self.isMinimized() or (handle is not None and not handle.isExposed()):
+            return
+        
+        self.animation_frame += step
+        
+        if self.phase == Phase.WAITING:
             # Slow breathing animation (3 second cycle)
-            cycle = (self.animation_frame * 0.1) % (2 * math.pi)
-            self._animation_scale = 1.0 + 0.1 * math.sin(cycle * 0.5)  # Slower cycle
-            self._animation_opacity = 0.7 + 0.3 * math.sin(cycle * 0.5)
+            cycle = (self.animation_frame * 0.1) % math.tau
+            wave = math.sin(cycle * 0.5)  # Slower cycle
+            self._animation_scale = 1.0 + 0.1 * wave
+            self._animation_opacity = 0.7 + 0.3 * wave
             
-        elif self.phase == 'resting':
+        elif self.phase == Phase.RESTING:
             # Fast pulse animation (1 second cycle)
-            cycle = (self.animation_frame * 0.05) % (2 * math.pi)
-            self._animation_scale = 1.0 + 0.2 * math.sin(cycle * 2)  # Faster pulse
-            self._animation_opacity = 0.6 + 0.4 * math.sin(cycle * 2)
-        
+            cycle = (self.animation_frame * 0.05) % math.tau
+            wave = math.sin(cycle * 2)  # Faster pulse
+            self._animation_scale = 1.0 + 0.2 * wave
+            self._animation_opacity = 0.6 + 0.4 * wave
+        
+        # Skip the repaint if the change wouldn't be visible
+        if (self._last_paint_scale is not None
+                and abs(self._animation_scale - self._last_paint_scale) * self.size < 1
+                and abs(self._animation_opacity - self._last_paint_opacity) < 1 / 256):
+            return
+        self._last_paint_scale = self._animation_scale
+        self._last_paint_opacity = self._animation_opacity
         self.update()
 
     def create_blink_widget(self):
@@ -385,9 +563,76 @@ class CircleWindow(QWidget):
         """Stop screen blinking effect"""
         pass
 
+    def get_pie_pixmap(self, color, angle, circle_size, max_scale=1.0):
+        """Return the progress pie for a color and angle, rendering it on first use"""
+        # Render at the largest scale the painter will apply so it never gets stretched
+        ratio = self.devicePixelRatioF() * max_scale
+        key = (color.rgba(), angle, ratio)
+        pixmap = self._pie_cache.get(key)
+        if pixmap is None:
+            # Round up so fractional ratios don't clip the right/bottom edge
+            pixmap_size = math.ceil(circle_size * ratio)
+            pixmap = QPixmap(pixmap_size, pixmap_size)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+            
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)  # Remove border
+            
+            # Background circle (empty part)
+            painter.setBrush(QBrush(self._qc_background))
+            painter.drawEllipse(0, 0, circle_size, circle_size)
+            
+            # Progress pie slice
+            painter.setBrush(QBrush(color))
+            painter.drawPie(0, 0, circle_size, circle_size, 90 * 16, -angle * 16)
+            painter.end()
+            
+            self._pie_cache[key] = pixmap
+        return pixmap
+
+    def paint_waiting(self, painter, margin, circle_size):
+        """Draw as filled circle for waiting phase only"""
+        painter.setBrush(QBrush(self._qc_waiting))
+        painter.setPen(Qt.NoPen)  # Remove border
+        painter.drawEllipse(margin, margin, circle_size, circle_size)
+
+    def paint_working(self, painter, margin, circle_size):
+        """Draw progress as a filled pie slice"""
+        # Background circle and progress pie slice, pre-rendered per angle
+        angle = int(360 * self.progress)
+        painter.drawPixmap(margin, margin, self.get_pie_pixmap(self._qc_working, angle, circle_size))
+
+    def paint_resting(self, painter, margin, circle_size):
+        """Draw progress as a filled pie slice for resting too"""
+        angle = int(360 * self.progress)
+        # The rest pulse scales up to 1.2x, so render the pie at that resolution
+        painter.drawPixmap(margin, margin, self.get_pie_pixmap(self._qc_resting, angle, circle_size, 1.2))
+
+    def paint_completing(self, painter, margin, circle_size):
+        """Draw as morphing shape during completion animation with rotation"""
+        # Transition color from work to rest during animation
+        colors = self._completing_colors
+        color = colors[min(self.completion_frame, len(colors) - 1)]
+        
+        painter.setBrush(QBrush(color))
+        painter.setPen(Qt.NoPen)  # Remove border
+        
+        # Apply shape morphing
+        morph_offset = int(circle_size * 0.3 * self._shape_morph)
+        ellipse_width = circle_size + morph_offset
+        ellipse_height = circle_size - morph_offset
+        
+        x_offset = (circle_size - ellipse_width) // 2
+        y_offset = (circle_size - ellipse_height) // 2
+        
+        painter.drawEllipse(margin + x_offset, margin + y_offset, ellipse_width, ellipse_height)
+
     def paintEvent(self, event):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
+        painter.setRenderHint(QPainter.SmoothPixmapTransform)
 
         # Apply animation transformations
         painter.setOpacity(self._animation_opacity)
@@ -403,92 +648,27 @@ class CircleWindow(QWidget):
         painter.rotate(self._animation_rotation)  # Add rotation
         painter.translate(-center_x, -center_y)
 
-        # Choose color based on phase
-        if self.phase == 'working':
-            color = self.parse_color(self.color_working)
-        elif self.phase == 'resting':
-            color = self.parse_color(self.color_resting)
-        elif self.phase == 'completing':
-            # Transition color from work to rest during animation
-            if hasattr(self, 'completion_frame') and hasattr(self, 'completion_duration'):
-                progress = min(1.0, (self.completion_frame * 33) / self.completion_duration)
-                work_color = self.parse_color(self.color_working)
-                rest_color = self.parse_color(self.color_resting)
-                
-                # Interpolate between work and rest colors
-                r = int(work_color.red() + (rest_color.red() - work_color.red()) * progress)
-                g = int(work_color.green() + (rest_color.green() - work_color.green()) * progress)
-                b = int(work_color.blue() + (rest_color.blue() - work_color.blue()) * progress)
-                color = QColor(r, g, b)
-            else:
-                color = self.parse_color(self.color_working)
-        else:  # waiting
-            color = self.parse_color(self.color_waiting)
-
         # Calculate circle dimensions
         margin = 5
         circle_size = self.size - 2 * margin
-        radius = circle_size // 2
 
-        if self.phase == 'working':
-            # Draw progress as a filled pie slice
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.NoPen)  # Remove border
-            
-            # Background circle (empty part)
-            bg_color = self.parse_color(self.color_background)
-            painter.setBrush(QBrush(bg_color))
-            painter.drawEllipse(margin, margin, circle_size, circle_size)
-            
-            # Progress pie slice
-            painter.setBrush(QBrush(color))
-            angle = int(360 * self.progress)
-            painter.drawPie(margin, margin, circle_size, circle_size, 90 * 16, -angle * 16)
-        elif self.phase == 'resting':
-            # Draw progress as a filled pie slice for resting too
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.NoPen)  # Remove border
-            
-            # Background circle (empty part)
-            bg_color = self.parse_color(self.color_background)
-            painter.setBrush(QBrush(bg_color))
-            painter.drawEllipse(margin, margin, circle_size, circle_size)
-            
-            # Progress pie slice
-            painter.setBrush(QBrush(color))
-            angle = int(360 * self.progress)
-            painter.drawPie(margin, margin, circle_size, circle_size, 90 * 16, -angle * 16)
-        elif self.phase == 'completing':
-            # Draw as morphing shape during completion animation with rotation
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.NoPen)  # Remove border
-            
-            # Apply shape morphing
-            morph_offset = int(circle_size * 0.3 * self._shape_morph)
-            ellipse_width = circle_size + morph_offset
-            ellipse_height = circle_size - morph_offset
-            
-            x_offset = (circle_size - ellipse_width) // 2
-            y_offset = (circle_size - ellipse_height) // 2
-            
-            painter.drawEllipse(margin + x_offset, margin + y_offset, ellipse_width, ellipse_height)
-        else:
-            # Draw as filled circle for waiting phase only
-            painter.setBrush(QBrush(color))
-            painter.setPen(Qt.NoPen)  # Remove border
-            painter.drawEllipse(margin, margin, circle_size, circle_size)
+        # Draw the shape for the current phase
+        self._paint_dispatch[self.phase](painter, margin, circle_size)
 
         # Restore painter state
         painter.restore()
 
     def update_progress(self):
-        if self.phase == 'waiting' or self.phase == 'completing' or self.is_paused:
+        if self.phase == Phase.WAITING:
+            self.check_cursor_activity()
+            return
+        if self.phase == Phase.COMPLETING or self.is_paused:
             # Don't update progress when paused
             return
         
         self.elapsed += 1
         
-        if self.phase == 'working':
+        if self.phase == Phase.WORKING:
             if self.elapsed >= self.work_duration:
                 print("Work session completed! Starting completion animation...")
                 self.start_completion_animation()  # Start dizzy animation first
@@ -497,7 +677,7 @@ class CircleWindow(QWidget):
                 # Progress decreases as time passes (starts full, goes to empty)
                 self.progress = max(0.0, 1.0 - (self.elapsed / self.work_duration))
                 
-        elif self.phase == 'resting':
+        elif self.phase == Phase.RESTING:
             if self.elapsed >= self.rest_duration:
                 print("Rest completed! Waiting for next session...")
                 self.start_waiting_phase()
@@ -505,76 +685,93 @@ class CircleWindow(QWidget):
                 # Progress decreases as time passes (starts full, goes to empty)
                 self.progress = max(0.0, 1.0 - (self.elapsed / self.rest_duration))
 
-        self.update()
+        # Only repaint when the visible pie angle actually changes
+        new_angle = int(360 * self.progress)
+        if new_angle != self._last_angle:
+            self._last_angle = new_angle
+            self.update()
 
     def start_work_phase(self):
         """Start a work session"""
-        self.phase = 'working'
+        self.phase = Phase.WORKING
         self.elapsed = 0
         self.progress = 1.0  # Start full
         self.is_paused = False
+        self._last_angle = None
         self.stop_listeners()
         self.stop_animation()  # Stop animations during work
+        self.set_tick_interval(1000)  # update every second
         print(f"Starting work session ({self.work_duration // 60} minutes)")
 
     def start_rest_phase(self):
         """Start a rest session"""
-        self.phase = 'resting'
+        self.phase = Phase.RESTING
         self.elapsed = 0
         self.progress = 1.0  # Start full
         self.is_paused = False
+        self._last_angle = None
         self.start_resting_animation()  # Start pulse animation
         print(f"Starting rest session ({self.rest_duration // 60} minutes)")
 
     def start_waiting_phase(self):
         """Wait for user input to start next work session"""
-        self.phase = 'waiting'
+        self.phase = Phase.WAITING
         self.elapsed = 0
         self.progress = 1.0  # Full circle in blue
         self.is_paused = False
+        self._last_angle = None
         self.start_listeners()
         self.start_waiting_animation()  # Start breathing animation
         print("Waiting for activity to start next work session...")
 
     def start_listeners(self):
-        """Start mouse and keyboard listeners (only during waiting phase)"""
-        if self.mouse_listener is None:
-            def on_input(*args):
-                if self.phase == 'waiting' and not self.is_dragging:
-                    self.start_work_phase()
-                # Don't respond to input during completion animation
-
-            # Mouse listener
-            self.mouse_listener = mouse.Listener(
-                on_move=on_input, 
-                on_click=on_input, 
-                on_scroll=on_input
-            )
-            self.mouse_listener.start()
-
-            # Keyboard listener
-            self.keyboard_listener = keyboard.Listener(
-                on_press=on_input, 
-                on_release=on_input
-            )
-            self.keyboard_listener.start()
+        """Start watching for user activity (only during waiting phase)"""
+        self.listening = True
+        self.last_cursor_pos = QCursor.pos()
 
     def stop_listeners(self):
-        """Stop mouse and keyboard listeners"""
-        if self.mouse_listener:
-            self.mouse_listener.stop()
-            self.mouse_listener = None
-        if self.keyboard_listener:
-            self.keyboard_listener.stop()
-            self.keyboard_listener = None
+        """Stop watching for user activity"""
+        self.listening = False
+        self.last_cursor_pos = None
+
+    def on_activity(self):
+        """Start a work session when activity is detected while waiting"""
+        if self.listening and self.phase == Phase.WAITING and not self.is_dragging:
+            self.start_work_phase()
+        # Don't respond to input during completion animation
+
+    def check_cursor_activity(self):
+        """Treat any cursor movement since the last tick as activity"""
+        if not self.listening:
+            return
+        if QCursor.pos() != self.last_cursor_pos:
+            self.on_activity()
+
+    def watch_primary_screen(self, screen):
+        """Track geometry changes of the (possibly new) primary screen"""
+        if self._screen is not None:
+            try:
+                self._screen.geometryChanged.disconnect(self.update_screen_geometry)
+            except (TypeError, RuntimeError):
+                pass  # Old screen already gone
+        self._screen = screen
+        screen.geometryChanged.connect(self.update_screen_geometry)
+        self.update_screen_geometry()
+
+    def update_screen_geometry(self, *args):
+        """Cache the primary screen geometry and the drag bounds derived from it"""
+        self._screen_geom = QApplication.primaryScreen().geometry()
+        # The window has a fixed size, so the furthest allowed position is fixed too
+        self._max_x = max(0, self._screen_geom.width() - self.size)
+        self._max_y = max(0, self._screen_geom.height() - self.size)
 
     def mousePressEvent(self, event):
         """Handle mouse press for immediate drag functionality"""
         if event.button() == Qt.LeftButton and not self.is_locked:
             self.drag_start_position = event.globalPos() - self.frameGeometry().topLeft()
             self.is_dragging = True
-            # Stop input listeners while dragging
-            if self.phase == 'waiting':
+            # Stop activity detection while dragging
+            if self.phase == Phase.WAITING:
                 self.stop_listeners()
 
     def mouseMoveEvent(self, event):
@@ -582,26 +779,37 @@ class CircleWindow(QWidget):
         if event.buttons() == Qt.LeftButton and self.is_dragging and not self.is_locked:
             new_pos = event.globalPos() - self.drag_start_position
             # Constrain to screen bounds
-            screen = QDesktopWidget().screenGeometry()
-            new_x = max(0, min(new_pos.x(), screen.width() - self.width()))
-            new_y = max(0, min(new_pos.y(), screen.height() - self.height()))
-            self.move(new_x, new_y)
+            nx = new_pos.x()
+            ny = new_pos.y()
+            max_x = self._max_x
+            max_y = self._max_y
+            self.move(0 if nx < 0 else max_x if nx > max_x else nx,
+                      0 if ny < 0 else max_y if ny > max_y else ny)
 
     def mouseReleaseEvent(self, event):
         """Handle mouse release"""
         if event.button() == Qt.LeftButton and self.is_dragging and not self.is_locked:
             self.is_dragging = False
             self.save_position()
-            # Restart listeners if in waiting phase
-            if self.phase == 'waiting':
+            # Restart activity detection if in waiting phase
+            if self.phase == Phase.WAITING:
                 self.start_listeners()
 
+    def changeEvent(self, event):
+        """Skip the completion animation if the window gets minimized"""
+        if (event.type() == QEvent.WindowStateChange and self.isMinimized()
+                and self.phase == Phase.COMPLETING):
+            self.finish_completion_animation()
+        super().changeEvent(event)
+
     def closeEvent(self, event):
-        """Clean up listeners and timers when closing the app"""
+        """Clean up activity detection and timers when closing the app"""
         self.stop_listeners()
         self.stop_animation()
-        if hasattr(self, 'completion_animation_timer') and self.completion_animation_timer:
-            self.completion_animation_timer.stop()
+        self._tick_timer.stop()
+        if self.save_timer.isActive():
+            self.save_timer.stop()
+            self._flush_config()
         event.accept()
 
 